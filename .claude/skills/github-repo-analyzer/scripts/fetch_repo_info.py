@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.11"
 # dependencies = [
-#   "requests>=2.31.0",
+#   "aiohttp>=3.9.0",
+#   "orjson>=3.9",
 # ]
 # ///
 # -*- coding: utf-8 -*-
@@ -9,6 +11,9 @@
 GitHub 仓库信息获取脚本
 获取仓库的所有重要信息，包括 README、Issues、Actions 等
 
+所有 API 请求通过 asyncio + aiohttp 并发发出：各项信息互相独立，
+并发后总耗时从"各请求 RTT 之和"降为"最慢请求的 RTT"。
+
 依赖管理：使用 PEP 723 内联依赖声明
 运行方式：uv run scripts/fetch_repo_info.py <仓库URL>
 虚拟环境：自动管理在系统缓存 (~/.cache/uv/)，不会污染项目或 Skill 目录
@@ -20,15 +25,26 @@ import json
 import base64
 import re
 import argparse
+import asyncio
+import atexit
+import hashlib
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse
-import requests
+import aiohttp
+
+# orjson 序列化大结果字典比 stdlib json 快数倍，不可用时回退 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class GitHubRepoAnalyzer:
     """GitHub 仓库分析器"""
-    
+
     # 常见文档文件列表
     COMMON_DOCS = [
         "CHANGELOG.md", "CHANGELOG",
@@ -43,11 +59,34 @@ class GitHubRepoAnalyzer:
         "CODE_OF_CONDUCT.md",
         "LICENSE", "LICENSE.md",
     ]
-    
+
+    # README 的常见命名；REST 的 /readme 端点会自动匹配，
+    # GraphQL 路径按这些别名逐个探测
+    README_CANDIDATES = [
+        "README.md", "README.rst", "README", "readme.md",
+    ]
+
+    # 预编译的 Markdown 链接正则，避免每次调用走 re 模块缓存查找
+    _LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+    # 外部链接前缀（http/https/锚点/邮件），单次扫描判定
+    _EXT_RE = re.compile(r'^(https?://|#|mailto:)')
+
+    # 瞬时错误重试策略：对应 requests 的 Retry(total=3, backoff_factor=0.5, status_forcelist=...)
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_FORCELIST = {500, 502, 503, 504}
+
+    # 速率限制策略：剩余额度低于阈值时等到重置，403/429 按退避重试
+    RATE_LIMIT_THRESHOLD = 5
+    RATE_LIMIT_MAX_RETRIES = 5
+
+    # 文件探测的最大并发数（相当于 ThreadPoolExecutor(max_workers=8)）
+    PROBE_CONCURRENCY = 8
+
     def __init__(self, token: Optional[str] = None):
         """
         初始化分析器
-        
+
         Args:
             token: GitHub Personal Access Token，如果为 None 则按优先级从多个来源读取：
                    1. .env 文件
@@ -57,19 +96,56 @@ class GitHubRepoAnalyzer:
         if not self.token:
             print("⚠️  警告: 未设置 GITHUB_TOKEN，将使用未认证请求（速率限制: 60次/小时）")
             print("ℹ️  建议: 复制 .env.example 为 .env 并填入你的 Token")
-        
+
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
         }
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
-        
+
         self.base_url = 'https://api.github.com'
-    
+        # aiohttp 会话在 analyze_repo 中创建一次，所有请求共享连接池
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        # 由响应头跟踪的速率限制状态
+        self._rate_remaining: Optional[int] = None
+        self._rate_reset: float = 0.0
+
+        # .github 目录列表缓存（按仓库存 Task，并发探测共享同一次调用）
+        self._github_dir_cache: Dict[str, asyncio.Task] = {}
+
+        # ETag 条件请求缓存：命中 304 时直接复用本地响应体，
+        # 且 GitHub 的 304 不计入主速率限制
+        self.cache_file = Path(__file__).parent.parent / 'output' / '.cache' / 'etags.json'
+        self.cache = self._load_cache()
+        self._cache_dirty = False
+        atexit.register(self._save_cache)
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        """加载 ETag 缓存文件，不存在或损坏时返回空缓存"""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️  读取 ETag 缓存失败: {e}")
+        return {}
+
+    def _save_cache(self) -> None:
+        """进程退出时落盘 ETag 缓存"""
+        if not self._cache_dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠️  保存 ETag 缓存失败: {e}")
+
     def _load_token(self) -> Optional[str]:
         """
         从多个来源加载 Token（按优先级）
-        
+
         Returns:
             Token 字符串，如果未找到则返回 None
         """
@@ -87,17 +163,17 @@ class GitHubRepoAnalyzer:
                                     return token
             except Exception as e:
                 print(f"⚠️  读取 .env 文件失败: {e}")
-        
+
         # 2. 从环境变量读取
         return os.getenv('GITHUB_TOKEN')
-    
+
     def parse_repo_url(self, repo_url: str) -> tuple:
         """
         解析仓库 URL，提取 owner 和 repo 名称
-        
+
         Args:
             repo_url: GitHub 仓库 URL，例如 https://github.com/facebook/react
-        
+
         Returns:
             (owner, repo) 元组
         """
@@ -105,150 +181,289 @@ class GitHubRepoAnalyzer:
         repo_url = repo_url.rstrip('/')
         if repo_url.endswith('.git'):
             repo_url = repo_url[:-4]
-        
+
         # 解析 URL
         parsed = urlparse(repo_url)
         path_parts = parsed.path.strip('/').split('/')
-        
+
         if len(path_parts) >= 2:
             return path_parts[0], path_parts[1]
         else:
             raise ValueError(f"无效的仓库 URL: {repo_url}")
-    
-    def make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+
+    async def make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
         """
         发送 GitHub API 请求
-        
+
         Args:
             endpoint: API 端点
             params: 查询参数
-        
+
         Returns:
             响应 JSON 数据，如果失败则返回 None
         """
         url = f"{self.base_url}{endpoint}"
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                print(f"⚠️  资源未找到: {endpoint}")
+
+        # 带上缓存的 ETag 做条件请求
+        cache_key = endpoint if not params else f"{endpoint}?{json.dumps(params, sort_keys=True)}"
+        cached = self.cache.get(cache_key)
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+
+        transient_left = self.RETRY_TOTAL
+        rate_left = self.RATE_LIMIT_MAX_RETRIES
+        attempt = 0
+
+        while True:
+            # 额度快用尽时先等到重置，避免并发下被静默 403 截断结果
+            await self._wait_for_rate_limit()
+            try:
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    self._update_rate_limit(response.headers)
+
+                    if response.status == 304:
+                        return cached['body']
+                    elif response.status == 200:
+                        body = await response.json()
+                        etag = response.headers.get('ETag')
+                        if etag:
+                            self.cache[cache_key] = {'etag': etag, 'body': body}
+                            self._cache_dirty = True
+                        return body
+                    elif response.status == 404:
+                        print(f"⚠️  资源未找到: {endpoint}")
+                        return None
+                    elif response.status in (403, 429) and rate_left > 0 and (
+                        response.status == 429 or self._is_rate_limit_403(response.headers)
+                    ):
+                        # 限流的 403/429 才重试，优先遵循 Retry-After；
+                        # 普通 403（权限、DMCA 等）走下面的分支立即失败
+                        rate_left -= 1
+                        attempt += 1
+                        retry_after = int(response.headers.get('Retry-After') or 0)
+                        delay = max(min(60, 2 ** attempt), retry_after)
+                        print(f"⚠️  触发速率限制 ({response.status}): {endpoint}，{delay}s 后重试...")
+                        await asyncio.sleep(delay)
+                        continue
+                    elif response.status in self.RETRY_STATUS_FORCELIST and transient_left > 0:
+                        # 5xx 按指数退避重试
+                        transient_left -= 1
+                        attempt += 1
+                        print(f"⚠️  请求失败 ({response.status}): {endpoint}，重试中...")
+                        await asyncio.sleep(self.RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+                        continue
+                    else:
+                        print(f"⚠️  请求失败 ({response.status}): {endpoint}")
+                        return None
+            except aiohttp.ClientError as e:
+                if transient_left > 0:
+                    transient_left -= 1
+                    attempt += 1
+                    print(f"⚠️  请求异常: {endpoint} - {e}，重试中...")
+                    await asyncio.sleep(self.RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+                    continue
+                print(f"❌ 请求异常: {endpoint} - {e}")
                 return None
-            else:
-                print(f"⚠️  请求失败 ({response.status_code}): {endpoint}")
+            except Exception as e:
+                print(f"❌ 请求异常: {endpoint} - {e}")
                 return None
-        except Exception as e:
-            print(f"❌ 请求异常: {endpoint} - {e}")
-            return None
-    
-    def get_basic_info(self, owner: str, repo: str) -> Optional[Dict]:
+
+    @staticmethod
+    def _is_rate_limit_403(headers) -> bool:
+        """判断 403 是否由限流引起（带 Retry-After 或额度已归零），否则重试无意义"""
+        if headers.get('Retry-After'):
+            return True
+        return headers.get('X-RateLimit-Remaining') == '0'
+
+    def _update_rate_limit(self, headers) -> None:
+        """从响应头更新剩余额度与重置时间"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            self._rate_remaining = int(remaining)
+            self._rate_reset = float(headers.get('X-RateLimit-Reset') or 0)
+        except ValueError:
+            pass
+
+    async def _wait_for_rate_limit(self) -> None:
+        """剩余额度低于阈值时，睡到限额重置再继续"""
+        if self._rate_remaining is None or self._rate_remaining > self.RATE_LIMIT_THRESHOLD:
+            return
+        delay = self._rate_reset - time.time() + 1
+        if delay > 0:
+            print(f"⏳ 速率额度仅剩 {self._rate_remaining}，等待 {delay:.0f}s 至限额重置...")
+            await asyncio.sleep(delay)
+        self._rate_remaining = None
+
+    async def get_basic_info(self, owner: str, repo: str) -> Optional[Dict]:
         """获取仓库基础信息"""
         print("📊 获取基础信息...")
-        return self.make_request(f'/repos/{owner}/{repo}')
-    
-    def get_readme(self, owner: str, repo: str) -> Optional[Dict]:
+        return await self.make_request(f'/repos/{owner}/{repo}')
+
+    async def get_readme(self, owner: str, repo: str) -> Optional[Dict]:
         """获取 README 内容"""
         print("📖 获取 README...")
-        data = self.make_request(f'/repos/{owner}/{repo}/readme')
+        data = await self.make_request(f'/repos/{owner}/{repo}/readme')
         if data and 'content' in data:
             # 解码 Base64 内容
             try:
                 content = base64.b64decode(data['content']).decode('utf-8')
                 data['decoded_content'] = content
+                self._strip_content_metadata(data)
             except Exception as e:
                 print(f"⚠️  解码 README 失败: {e}")
         return data
-    
+
+    @staticmethod
+    def _strip_content_metadata(data: Dict) -> None:
+        """解码后丢弃 Base64 原文和无用元数据字段
+
+        原始响应同时保留 content（Base64）和 decoded_content（明文），
+        内存和落盘体积都翻倍；API URLs、SHA 等字段下游也用不到。
+        """
+        data.pop('content', None)
+        for key in ('encoding', '_links', 'git_url', 'download_url', 'sha', 'node_id'):
+            data.pop(key, None)
+
     def extract_links_from_markdown(self, content: str) -> List[str]:
         """
         从 Markdown 内容中提取链接
-        
+
         Args:
             content: Markdown 文本
-        
+
         Returns:
             链接列表
         """
-        # 匹配 [text](url) 格式的链接
-        pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        matches = re.findall(pattern, content)
-        
-        links = []
-        for text, url in matches:
-            # 只保留相对路径（仓库内部文档）
-            if not url.startswith(('http://', 'https://', '#', 'mailto:')):
-                links.append({'text': text, 'url': url})
-        
-        return links
-    
-    def get_file_content(self, owner: str, repo: str, path: str) -> Optional[Dict]:
+        # 按内容摘要缓存：同一 README（跨仓库 fork 很常见）只做一次正则提取
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest()
+        return list(_links_for_digest(digest, content))
+
+    async def get_file_content(self, owner: str, repo: str, path: str) -> Optional[Dict]:
         """
         获取指定文件的内容
-        
+
         Args:
             owner: 仓库所有者
             repo: 仓库名称
             path: 文件路径
-        
+
         Returns:
             文件信息和内容
         """
-        data = self.make_request(f'/repos/{owner}/{repo}/contents/{path}')
+        data = await self.make_request(f'/repos/{owner}/{repo}/contents/{path}')
         if data and isinstance(data, dict) and 'content' in data:
             try:
                 content = base64.b64decode(data['content']).decode('utf-8')
                 data['decoded_content'] = content
+                self._strip_content_metadata(data)
             except:
                 pass
         return data
-    
-    def get_common_docs(self, owner: str, repo: str) -> Dict[str, Any]:
-        """获取常见文档文件"""
+
+    async def _gather_limited(self, coros) -> List:
+        """并发执行一组协程，但把并发度限制在 PROBE_CONCURRENCY 以内"""
+        semaphore = asyncio.Semaphore(self.PROBE_CONCURRENCY)
+
+        async def _run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(_run(coro) for coro in coros))
+
+    async def get_root_tree(self, owner: str, repo: str, ref: str) -> Optional[List[Dict]]:
+        """
+        获取指定分支的根目录 tree
+
+        一次调用即可知道根目录有哪些文件，后续只需抓取真实存在的文件，
+        避免对不存在的文件逐个发 404 探测请求。
+
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            ref: 分支名或 tree SHA
+
+        Returns:
+            tree 条目列表，失败时返回 None
+        """
+        data = await self.make_request(f'/repos/{owner}/{repo}/git/trees/{ref}')
+        if data and isinstance(data.get('tree'), list):
+            return data['tree']
+        return None
+
+    async def get_common_docs(self, owner: str, repo: str,
+                              root_tree: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """获取常见文档文件（按根 tree 过滤后并发抓取）"""
         print("📄 检测常见文档文件...")
         docs = {}
-        
-        for doc_name in self.COMMON_DOCS:
-            data = self.get_file_content(owner, repo, doc_name)
+
+        if root_tree is not None:
+            # 大小写不敏感地与根目录文件求交集，只抓取真实存在的文件
+            existing = {e['path'].lower(): e['path'] for e in root_tree if e['type'] == 'blob'}
+            candidates = list(dict.fromkeys(
+                existing[name.lower()] for name in self.COMMON_DOCS if name.lower() in existing
+            ))
+        else:
+            # 根 tree 不可用时退回逐个探测
+            candidates = self.COMMON_DOCS
+
+        results = await self._gather_limited(
+            self.get_file_content(owner, repo, doc_name) for doc_name in candidates
+        )
+        for doc_name, data in zip(candidates, results):
             if data:
                 docs[doc_name] = data
                 print(f"  ✓ 找到: {doc_name}")
-        
+
         return docs
-    
-    def get_directory_contents(self, owner: str, repo: str, path: str = '') -> Optional[List]:
+
+    async def get_directory_contents(self, owner: str, repo: str, path: str = '') -> Optional[List]:
         """
         获取目录内容
-        
+
         Args:
             owner: 仓库所有者
             repo: 仓库名称
             path: 目录路径，默认为根目录
-        
+
         Returns:
             文件和目录列表
         """
         endpoint = f'/repos/{owner}/{repo}/contents/{path}' if path else f'/repos/{owner}/{repo}/contents'
-        return self.make_request(endpoint)
-    
-    def get_docs_directory(self, owner: str, repo: str) -> Optional[List]:
+        return await self.make_request(endpoint)
+
+    async def _get_github_dir(self, owner: str, repo: str) -> Optional[List]:
+        """
+        列出 .github 目录内容，按仓库缓存
+
+        PR 模板、工作流、Issue 模板的存在性判断共享这一次调用；
+        缓存的是 Task，因此并发探测也只触发一次请求。
+        """
+        key = f"{owner}/{repo}"
+        if key not in self._github_dir_cache:
+            self._github_dir_cache[key] = asyncio.ensure_future(
+                self.get_directory_contents(owner, repo, '.github')
+            )
+        return await self._github_dir_cache[key]
+
+    async def get_docs_directory(self, owner: str, repo: str) -> Optional[List]:
         """获取 docs/ 目录内容"""
         print("📚 扫描 docs/ 目录...")
-        data = self.get_directory_contents(owner, repo, 'docs')
+        data = await self.get_directory_contents(owner, repo, 'docs')
         if data:
             print(f"  ✓ 找到 {len(data)} 个文件/目录")
         return data
-    
-    def get_issues(self, owner: str, repo: str, sort: str = 'reactions', per_page: int = 10) -> Optional[List]:
+
+    async def get_issues(self, owner: str, repo: str, sort: str = 'reactions', per_page: int = 10) -> Optional[List]:
         """
         获取 Issues
-        
+
         Args:
             owner: 仓库所有者
             repo: 仓库名称
             sort: 排序方式，默认按反应数
             per_page: 每页数量
-        
+
         Returns:
             Issue 列表
         """
@@ -258,90 +473,480 @@ class GitHubRepoAnalyzer:
             'per_page': per_page,
             'state': 'all'  # 包含开放和关闭的 Issue
         }
-        return self.make_request(f'/repos/{owner}/{repo}/issues', params)
-    
-    def get_workflows(self, owner: str, repo: str) -> Optional[List]:
+        return await self.make_request(f'/repos/{owner}/{repo}/issues', params)
+
+    async def _github_subdir_exists(self, owner: str, repo: str, name: str) -> bool:
+        """通过 .github 目录列表判断子目录是否存在"""
+        github_dir = await self._get_github_dir(owner, repo)
+        if github_dir is None:
+            return False
+        return any(
+            e.get('name') == name and e.get('type') == 'dir' for e in github_dir
+        )
+
+    async def get_workflows(self, owner: str, repo: str) -> Optional[List]:
         """获取 GitHub Actions 工作流"""
         print("⚙️  获取 GitHub Actions 工作流...")
-        data = self.get_directory_contents(owner, repo, '.github/workflows')
+        if not await self._github_subdir_exists(owner, repo, 'workflows'):
+            return None
+        data = await self.get_directory_contents(owner, repo, '.github/workflows')
         if data:
             print(f"  ✓ 找到 {len(data)} 个工作流")
         return data
-    
-    def get_releases(self, owner: str, repo: str, per_page: int = 5) -> Optional[List]:
+
+    async def get_releases(self, owner: str, repo: str, per_page: int = 5) -> Optional[List]:
         """获取最新的 Releases"""
         print(f"🚀 获取最新 {per_page} 个 Releases...")
         params = {'per_page': per_page}
-        return self.make_request(f'/repos/{owner}/{repo}/releases', params)
-    
-    def get_pr_template(self, owner: str, repo: str) -> Optional[Dict]:
+        return await self.make_request(f'/repos/{owner}/{repo}/releases', params)
+
+    async def get_pr_template(self, owner: str, repo: str,
+                              root_tree: Optional[List[Dict]] = None) -> Optional[Dict]:
         """获取 PR 模板"""
         print("📝 获取 PR 模板...")
-        # PR 模板可能在多个位置
+        # PR 模板可能在多个位置，并发探测后按优先级取第一个命中
         possible_paths = [
             '.github/PULL_REQUEST_TEMPLATE.md',
             'PULL_REQUEST_TEMPLATE.md',
             '.github/pull_request_template.md',
         ]
-        
-        for path in possible_paths:
-            data = self.get_file_content(owner, repo, path)
+
+        if root_tree is not None:
+            # 根 tree 判定根目录文件，.github 目录列表（全局缓存，工作流/Issue 模板
+            # 探测共用）判定 .github 下的文件，过滤掉必然 404 的探测
+            root_blobs = {e['path'].lower() for e in root_tree if e['type'] == 'blob'}
+            github_dir = await self._get_github_dir(owner, repo)
+            github_files = {
+                e.get('name', '').lower()
+                for e in (github_dir or ())
+                if e.get('type') == 'file'
+            }
+
+            def _exists(path: str) -> bool:
+                if path.startswith('.github/'):
+                    return path[len('.github/'):].lower() in github_files
+                return path.lower() in root_blobs
+
+            # 两个 .github 候选小写后同名，按小写去重、保留优先级靠前的，
+            # 避免命中一个时还另发一个必然 404 的请求
+            surviving: Dict[str, str] = {}
+            for path in possible_paths:
+                if _exists(path):
+                    surviving.setdefault(path.lower(), path)
+            possible_paths = list(surviving.values())
+
+        results = await self._gather_limited(
+            self.get_file_content(owner, repo, path) for path in possible_paths
+        )
+        for path, data in zip(possible_paths, results):
             if data:
                 print(f"  ✓ 找到: {path}")
                 return data
-        
+
         return None
-    
-    def get_issue_templates(self, owner: str, repo: str) -> Optional[List]:
+
+    async def get_issue_templates(self, owner: str, repo: str) -> Optional[List]:
         """获取 Issue 模板"""
         print("📋 获取 Issue 模板...")
-        data = self.get_directory_contents(owner, repo, '.github/ISSUE_TEMPLATE')
+        if not await self._github_subdir_exists(owner, repo, 'ISSUE_TEMPLATE'):
+            return None
+        data = await self.get_directory_contents(owner, repo, '.github/ISSUE_TEMPLATE')
         if data:
             print(f"  ✓ 找到 {len(data)} 个模板")
         return data
-    
-    def analyze_repo(self, repo_url: str) -> Dict:
+
+    def _new_session(self, total_timeout: float = 10) -> aiohttp.ClientSession:
+        """创建带连接池的 aiohttp 会话，keep-alive 避免重复 TLS 握手"""
+        connector = aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=total_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers)
+
+    async def analyze_repo(self, repo_url: str) -> Dict:
         """
-        分析仓库并获取所有信息
-        
+        分析仓库并获取所有信息（各项信息并发抓取）
+
         Args:
             repo_url: GitHub 仓库 URL
-        
+
         Returns:
             包含所有信息的字典
         """
+        # 单个会话供本次分析的全部请求复用
+        async with self._new_session() as session:
+            self.session = session
+            try:
+                return await self._analyze_repo_impl(repo_url)
+            finally:
+                self.session = None
+
+    async def _analyze_repo_impl(self, repo_url: str) -> Dict:
+        """在已就绪的会话上执行一次完整分析"""
         print(f"\n🔍 开始分析仓库: {repo_url}\n")
-        
+
         # 解析 URL
         owner, repo = self.parse_repo_url(repo_url)
         print(f"📦 仓库: {owner}/{repo}\n")
-        
-        # 收集所有信息
+
+        # 先拿基础信息和默认分支的根 tree，供文件存在性过滤使用
+        basic_info = await self.get_basic_info(owner, repo)
+        default_branch = (basic_info or {}).get('default_branch') or 'HEAD'
+        root_tree = await self.get_root_tree(owner, repo, default_branch)
+
+        # 其余信息互相独立，并发收集
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                'readme': tg.create_task(self.get_readme(owner, repo)),
+                'common_docs': tg.create_task(self.get_common_docs(owner, repo, root_tree)),
+                'docs_directory': tg.create_task(self.get_docs_directory(owner, repo)),
+                'root_contents': tg.create_task(self.get_directory_contents(owner, repo)),
+                'issues': tg.create_task(self.get_issues(owner, repo)),
+                'workflows': tg.create_task(self.get_workflows(owner, repo)),
+                'releases': tg.create_task(self.get_releases(owner, repo)),
+                'pr_template': tg.create_task(self.get_pr_template(owner, repo, root_tree)),
+                'issue_templates': tg.create_task(self.get_issue_templates(owner, repo)),
+            }
+
         result = {
             'repository_url': repo_url,
             'owner': owner,
             'repo': repo,
-            'basic_info': self.get_basic_info(owner, repo),
-            'readme': self.get_readme(owner, repo),
-            'common_docs': self.get_common_docs(owner, repo),
-            'docs_directory': self.get_docs_directory(owner, repo),
-            'root_contents': self.get_directory_contents(owner, repo),
-            'issues': self.get_issues(owner, repo),
-            'workflows': self.get_workflows(owner, repo),
-            'releases': self.get_releases(owner, repo),
-            'pr_template': self.get_pr_template(owner, repo),
-            'issue_templates': self.get_issue_templates(owner, repo),
+            'basic_info': basic_info,
         }
-        
+        result.update({key: task.result() for key, task in tasks.items()})
+
         # 从 README 中提取链接
         if result['readme'] and 'decoded_content' in result['readme']:
             readme_content = result['readme']['decoded_content']
             result['readme_links'] = self.extract_links_from_markdown(readme_content)
             print(f"\n🔗 从 README 中提取了 {len(result['readme_links'])} 个内部链接")
-        
+
         print("\n✅ 分析完成！\n")
         return result
 
+    async def analyze_repos(self, repo_urls: List[str], jobs: int = 4) -> List[Optional[Dict]]:
+        """
+        批量分析多个仓库
+
+        所有仓库共享同一个会话（连接池与速率限制状态复用），
+        用 Semaphore 把同时分析的仓库数限制在 jobs 以内。
+
+        Args:
+            repo_urls: GitHub 仓库 URL 列表
+            jobs: 并发分析的仓库数上限
+
+        Returns:
+            与输入顺序对应的结果列表，失败项为 None
+        """
+        async with self._new_session() as session:
+            self.session = session
+            semaphore = asyncio.Semaphore(jobs)
+
+            async def _analyze_one(url: str) -> Optional[Dict]:
+                async with semaphore:
+                    try:
+                        return await self._analyze_repo_impl(url)
+                    except Exception as e:
+                        print(f"❌ 分析失败: {url} - {e}")
+                        return None
+
+            try:
+                return await asyncio.gather(*(_analyze_one(url) for url in repo_urls))
+            finally:
+                self.session = None
+
+    async def make_graphql_request(self, query: str, variables: Dict) -> Optional[Dict]:
+        """
+        发送 GitHub GraphQL v4 请求
+
+        Args:
+            query: GraphQL 查询语句
+            variables: 查询变量
+
+        Returns:
+            响应中的 data 字段，如果失败则返回 None
+        """
+        url = f"{self.base_url}/graphql"
+        try:
+            async with self.session.post(url, json={'query': query, 'variables': variables}) as response:
+                if response.status != 200:
+                    print(f"⚠️  GraphQL 请求失败 ({response.status})")
+                    return None
+                payload = await response.json()
+                if payload.get('errors'):
+                    for err in payload['errors']:
+                        print(f"⚠️  GraphQL 错误: {err.get('message', err)}")
+                return payload.get('data')
+        except Exception as e:
+            print(f"❌ GraphQL 请求异常: {e}")
+            return None
+
+    def _build_graphql_query(self) -> str:
+        """构造一次性抓取所有仓库信息的 GraphQL 查询"""
+        # 常见文档逐个起别名，全部塞进同一次查询
+        doc_fields = '\n'.join(
+            f'doc{i}: object(expression: "HEAD:{name}") {{ ... on Blob {{ text }} }}'
+            for i, name in enumerate(self.COMMON_DOCS)
+        )
+        readme_fields = '\n'.join(
+            f'readme{i}: object(expression: "HEAD:{name}") {{ ... on Blob {{ text }} }}'
+            for i, name in enumerate(self.README_CANDIDATES)
+        )
+        return f'''
+query($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{
+    name
+    nameWithOwner
+    description
+    homepageUrl
+    url
+    stargazerCount
+    forkCount
+    watchers {{ totalCount }}
+    openIssues: issues(states: OPEN) {{ totalCount }}
+    primaryLanguage {{ name }}
+    licenseInfo {{ name }}
+    repositoryTopics(first: 20) {{ nodes {{ topic {{ name }} }} }}
+    createdAt
+    updatedAt
+    pushedAt
+    defaultBranchRef {{ name }}
+    diskUsage
+    isFork
+    isArchived
+    {readme_fields}
+    topIssues: issues(first: 10, states: [OPEN, CLOSED],
+                      orderBy: {{field: COMMENTS, direction: DESC}}) {{
+      nodes {{
+        number
+        title
+        state
+        body
+        createdAt
+        updatedAt
+        author {{ login }}
+        comments {{ totalCount }}
+        reactions {{ totalCount }}
+        labels(first: 10) {{ nodes {{ name }} }}
+      }}
+    }}
+    releases(first: 5, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      nodes {{
+        tagName
+        name
+        publishedAt
+        isPrerelease
+        description
+        author {{ login }}
+      }}
+    }}
+    rootTree: object(expression: "HEAD:") {{ ... on Tree {{ entries {{ name type }} }} }}
+    docsTree: object(expression: "HEAD:docs") {{ ... on Tree {{ entries {{ name type }} }} }}
+    workflowsTree: object(expression: "HEAD:.github/workflows") {{ ... on Tree {{ entries {{ name }} }} }}
+    issueTemplatesTree: object(expression: "HEAD:.github/ISSUE_TEMPLATE") {{ ... on Tree {{ entries {{ name }} }} }}
+    prTemplate: object(expression: "HEAD:.github/PULL_REQUEST_TEMPLATE.md") {{ ... on Blob {{ text }} }}
+    prTemplateRoot: object(expression: "HEAD:PULL_REQUEST_TEMPLATE.md") {{ ... on Blob {{ text }} }}
+    {doc_fields}
+  }}
+}}
+'''
+
+    def _map_graphql_result(self, repo_data: Dict) -> Dict:
+        """将 GraphQL 响应映射为与 REST 路径一致的结果结构"""
+        blob_text = lambda obj: (obj or {}).get('text')
+        # git 对象类型对齐 REST contents API 的命名（tree→dir, blob→file）
+        git_type = {'tree': 'dir', 'blob': 'file'}
+        tree_entries = lambda obj, entry_type=None: [
+            {
+                'name': e.get('name', ''),
+                'type': entry_type or git_type.get(e.get('type', ''), e.get('type', '')),
+            }
+            for e in ((repo_data.get(obj) or {}).get('entries') or [])
+        ]
+
+        basic_info = {
+            'name': repo_data.get('name', ''),
+            'full_name': repo_data.get('nameWithOwner', ''),
+            'description': repo_data.get('description', ''),
+            'homepage': repo_data.get('homepageUrl', ''),
+            'html_url': repo_data.get('url', ''),
+            'stargazers_count': repo_data.get('stargazerCount', 0),
+            'forks_count': repo_data.get('forkCount', 0),
+            'watchers_count': (repo_data.get('watchers') or {}).get('totalCount', 0),
+            'open_issues_count': (repo_data.get('openIssues') or {}).get('totalCount', 0),
+            'language': (repo_data.get('primaryLanguage') or {}).get('name', ''),
+            'license': repo_data.get('licenseInfo'),
+            'topics': [
+                n['topic']['name']
+                for n in ((repo_data.get('repositoryTopics') or {}).get('nodes') or [])
+            ],
+            'created_at': repo_data.get('createdAt', ''),
+            'updated_at': repo_data.get('updatedAt', ''),
+            'pushed_at': repo_data.get('pushedAt', ''),
+            'default_branch': (repo_data.get('defaultBranchRef') or {}).get('name', ''),
+            'size': repo_data.get('diskUsage', 0),
+            'fork': repo_data.get('isFork', False),
+            'archived': repo_data.get('isArchived', False),
+        }
+
+        issues = [
+            {
+                'number': n.get('number', 0),
+                'title': n.get('title', ''),
+                'state': (n.get('state') or '').lower(),
+                'body': n.get('body', ''),
+                'created_at': n.get('createdAt', ''),
+                'updated_at': n.get('updatedAt', ''),
+                'user': {'login': (n.get('author') or {}).get('login', '')},
+                'comments': (n.get('comments') or {}).get('totalCount', 0),
+                'reactions': {'total_count': (n.get('reactions') or {}).get('totalCount', 0)},
+                'labels': (n.get('labels') or {}).get('nodes') or [],
+            }
+            for n in ((repo_data.get('topIssues') or {}).get('nodes') or [])
+        ]
+
+        releases = [
+            {
+                'tag_name': n.get('tagName', ''),
+                'name': n.get('name', ''),
+                'published_at': n.get('publishedAt', ''),
+                'prerelease': n.get('isPrerelease', False),
+                'body': n.get('description', ''),
+                'author': {'login': (n.get('author') or {}).get('login', '')},
+            }
+            for n in ((repo_data.get('releases') or {}).get('nodes') or [])
+        ]
+
+        common_docs = {}
+        for i, doc_name in enumerate(self.COMMON_DOCS):
+            text = blob_text(repo_data.get(f'doc{i}'))
+            if text is not None:
+                common_docs[doc_name] = {'decoded_content': text}
+                print(f"  ✓ 找到: {doc_name}")
+
+        # 按候选命名的优先级取第一个命中的 README
+        readme_text = next(
+            (
+                text for i in range(len(self.README_CANDIDATES))
+                if (text := blob_text(repo_data.get(f'readme{i}'))) is not None
+            ),
+            None,
+        )
+        pr_template_text = blob_text(repo_data.get('prTemplate')) or blob_text(repo_data.get('prTemplateRoot'))
+
+        return {
+            'basic_info': basic_info,
+            'readme': {'decoded_content': readme_text} if readme_text is not None else None,
+            'common_docs': common_docs,
+            'docs_directory': tree_entries('docsTree') or None,
+            'root_contents': tree_entries('rootTree') or None,
+            'issues': issues,
+            'workflows': tree_entries('workflowsTree', 'file') or None,
+            'releases': releases,
+            'pr_template': {'decoded_content': pr_template_text} if pr_template_text else None,
+            'issue_templates': tree_entries('issueTemplatesTree', 'file') or None,
+        }
+
+    async def analyze_repo_graphql(self, repo_url: str) -> Dict:
+        """
+        通过 GraphQL v4 单次请求分析仓库
+
+        一条查询同时取回基础信息、README、Issues、Releases、常见文档等，
+        相比 REST 路径省掉 8+ 次往返；结果结构与 analyze_repo 完全一致。
+
+        Args:
+            repo_url: GitHub 仓库 URL
+
+        Returns:
+            包含所有信息的字典
+        """
+        print(f"\n🔍 开始分析仓库 (GraphQL): {repo_url}\n")
+
+        owner, repo = self.parse_repo_url(repo_url)
+        print(f"📦 仓库: {owner}/{repo}\n")
+
+        async with self._new_session(total_timeout=30) as session:
+            self.session = session
+            data = await self.make_graphql_request(
+                self._build_graphql_query(), {'owner': owner, 'name': repo}
+            )
+            self.session = None
+
+        repo_data = (data or {}).get('repository')
+        if not repo_data:
+            raise RuntimeError(f"GraphQL 查询失败: {owner}/{repo}")
+
+        result = {
+            'repository_url': repo_url,
+            'owner': owner,
+            'repo': repo,
+        }
+        result.update(self._map_graphql_result(repo_data))
+
+        # 从 README 中提取链接
+        if result['readme'] and 'decoded_content' in result['readme']:
+            readme_content = result['readme']['decoded_content']
+            result['readme_links'] = self.extract_links_from_markdown(readme_content)
+            print(f"\n🔗 从 README 中提取了 {len(result['readme_links'])} 个内部链接")
+
+        print("\n✅ 分析完成！\n")
+        return result
+
+
+@lru_cache(maxsize=128)
+def _links_for_digest(digest: bytes, content: str) -> tuple:
+    """
+    提取 Markdown 内部链接，按内容摘要做 LRU 缓存
+
+    Args:
+        digest: 内容的 blake2b 摘要，作为缓存键的主体
+        content: Markdown 文本
+
+    Returns:
+        链接元组，元素为 {'text': ..., 'url': ...}
+    """
+    return tuple(
+        {'text': text, 'url': url}
+        for text, url in GitHubRepoAnalyzer._LINK_RE.findall(content)
+        # 只保留相对路径（仓库内部文档）
+        if not GitHubRepoAnalyzer._EXT_RE.match(url)
+    )
+
+
+def save_result(result: Dict, output: Optional[str] = None) -> Path:
+    """
+    保存分析结果为 JSON 文件
+
+    Args:
+        result: analyze_repo 的结果字典
+        output: 输出文件名，为 None 时保存到 output/{owner}_{repo}/raw_data.json
+
+    Returns:
+        实际写入的文件路径
+    """
+    if output:
+        output_file = Path(output)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        # 默认保存到 output/{owner}_{repo}/ 目录
+        script_dir = Path(__file__).parent.parent  # .claude/skills/github-repo-analyzer/
+        output_dir = script_dir / 'output' / f"{result['owner']}_{result['repo']}"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / 'raw_data.json'
+
+    # 先整块序列化成字节再写临时文件，os.replace 原子替换：
+    # 跳过文本编码器逐字符写入，写一半崩溃也不会留下残缺的 JSON
+    if orjson is not None:
+        payload = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(result, ensure_ascii=False, indent=2).encode('utf-8')
+
+    tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, output_file)
+
+    print(f"📁 数据已保存到: {output_file}")
+    return output_file
+
 
 def main():
     """主函数"""
@@ -354,50 +959,90 @@ def main():
   python fetch_repo_info.py https://github.com/facebook/react
   python fetch_repo_info.py https://github.com/torvalds/linux --token ghp_xxx
   python fetch_repo_info.py https://github.com/microsoft/vscode -o custom_output.json
+  python fetch_repo_info.py --repos-file repos.txt --jobs 4
         '''
     )
-    
+
     parser.add_argument(
         'repo_url',
+        nargs='?',
         help='GitHub 仓库 URL'
     )
-    
+
     parser.add_argument(
         '-t', '--token',
         help='GitHub Personal Access Token（可选，也可通过 .env 文件或环境变量设置）'
     )
-    
+
     parser.add_argument(
         '-o', '--output',
         help='输出文件名（可选，默认保存到 output/{owner}_{repo}/raw_data.json）'
     )
-    
+
+    parser.add_argument(
+        '--graphql',
+        action='store_true',
+        help='使用 GraphQL v4 单次请求抓取（需要 Token，速率消耗更低）'
+    )
+
+    parser.add_argument(
+        '--repos-file',
+        help='批量模式：按行读取仓库 URL 列表文件并并发分析（# 开头的行忽略）'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=4,
+        help='批量模式下同时分析的仓库数上限（默认: 4）'
+    )
+
     args = parser.parse_args()
-    
+
+    if not args.repo_url and not args.repos_file:
+        parser.error('需要提供仓库 URL 或 --repos-file')
+
     # 创建分析器
     analyzer = GitHubRepoAnalyzer(token=args.token)
-    
+
+    # 批量模式：共享会话并发分析多个仓库
+    if args.repos_file:
+        if args.output:
+            print("⚠️  批量模式忽略 -o/--output，结果保存到 output/{owner}_{repo}/raw_data.json")
+        if args.graphql:
+            print("⚠️  批量模式暂不支持 --graphql，使用 REST 路径")
+        with open(args.repos_file, 'r', encoding='utf-8') as f:
+            repo_urls = [
+                line.strip() for line in f
+                if line.strip() and not line.strip().startswith('#')
+            ]
+        print(f"📚 批量分析 {len(repo_urls)} 个仓库（并发 {args.jobs}）...")
+
+        results = asyncio.run(analyzer.analyze_repos(repo_urls, jobs=args.jobs))
+        for result in results:
+            if result:
+                save_result(result)
+
+        succeeded = sum(1 for r in results if r)
+        print(f"\n📦 批量分析完成: {succeeded}/{len(repo_urls)} 成功")
+        return
+
     # 分析仓库
-    result = analyzer.analyze_repo(args.repo_url)
-    
-    # 确定输出路径
-    if args.output:
-        output_file = Path(args.output)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    if args.graphql and not analyzer.token:
+        print("⚠️  GraphQL API 需要 Token，回退到 REST 模式")
+        args.graphql = False
+
+    if args.graphql:
+        try:
+            result = asyncio.run(analyzer.analyze_repo_graphql(args.repo_url))
+        except RuntimeError as e:
+            print(f"⚠️  GraphQL 分析失败: {e}，回退到 REST 模式")
+            result = asyncio.run(analyzer.analyze_repo(args.repo_url))
     else:
-        # 默认保存到 output/{owner}_{repo}/ 目录
-        script_dir = Path(__file__).parent.parent  # .claude/skills/github-repo-analyzer/
-        output_dir = script_dir / 'output' / f"{result['owner']}_{result['repo']}"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / 'raw_data.json'
-    
-    # 保存为 JSON 文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-    
-    print(f"📁 数据已保存到: {output_file}")
+        result = asyncio.run(analyzer.analyze_repo(args.repo_url))
+
+    save_result(result, args.output)
 
 
 if __name__ == '__main__':
     main()
-
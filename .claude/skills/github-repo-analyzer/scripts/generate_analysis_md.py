@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = []
+# dependencies = [
+#   "orjson>=3.9",
+# ]
 # ///
 # -*- coding: utf-8 -*-
 """
@@ -16,175 +18,184 @@ import argparse
 from pathlib import Path
 from typing import Dict
 
+# orjson 解析大 JSON 更快更省内存，不可用时回退 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_markdown(data: Dict) -> str:
-    """将 JSON 数据转换为格式化的 Markdown，适合 LLM 分析"""
 
-    md_lines = []
+def iter_markdown(data: Dict):
+    """逐行生成格式化的 Markdown，供调用方流式写盘
+
+    以生成器方式逐行产出（不含换行符），峰值内存只有单行大小，
+    不再在内存中拼出完整文档。
+    """
 
     # 基本信息
-    md_lines.append("# GitHub Repository Analysis Data")
-    md_lines.append("")
-    md_lines.append(f"**Repository**: {data.get('repository_url', '')}")
-    md_lines.append(f"**Owner**: {data.get('owner', '')}")
-    md_lines.append(f"**Name**: {data.get('repo', '')}")
-    md_lines.append("")
-
-    # 统计信息
-    basic = data.get('basic_info', {})
-    md_lines.append("## Basic Statistics")
-    md_lines.append("")
-    md_lines.append(f"- **Stars**: {basic.get('stars', 0):,}")
-    md_lines.append(f"- **Forks**: {basic.get('forks', 0):,}")
-    md_lines.append(f"- **Open Issues**: {basic.get('open_issues', 0):,}")
-    md_lines.append(f"- **Language**: {basic.get('language', 'N/A')}")
-    md_lines.append(f"- **License**: {basic.get('license', 'N/A')}")
-    md_lines.append(f"- **Topics**: {', '.join(basic.get('topics', []))}")
-    md_lines.append(f"- **Created**: {basic.get('created_at', 'N/A')}")
-    md_lines.append(f"- **Last Updated**: {basic.get('updated_at', 'N/A')}")
-    md_lines.append(f"- **Last Push**: {basic.get('pushed_at', 'N/A')}")
-    md_lines.append("")
+    yield "# GitHub Repository Analysis Data"
+    yield ""
+    yield f"**Repository**: {data.get('repository_url', '')}"
+    yield f"**Owner**: {data.get('owner', '')}"
+    yield f"**Name**: {data.get('repo', '')}"
+    yield ""
+
+    # 统计信息（千分位数字预先 format，避免 f-string 格式说明符开销）
+    bg = data.get('basic_info', {}).get
+    yield "## Basic Statistics"
+    yield ""
+    yield f"- **Stars**: {format(bg('stars', 0), ',')}"
+    yield f"- **Forks**: {format(bg('forks', 0), ',')}"
+    yield f"- **Open Issues**: {format(bg('open_issues', 0), ',')}"
+    yield f"- **Language**: {bg('language', 'N/A')}"
+    yield f"- **License**: {bg('license', 'N/A')}"
+    yield f"- **Topics**: {', '.join(bg('topics', []))}"
+    yield f"- **Created**: {bg('created_at', 'N/A')}"
+    yield f"- **Last Updated**: {bg('updated_at', 'N/A')}"
+    yield f"- **Last Push**: {bg('pushed_at', 'N/A')}"
+    yield ""
 
     # README 内容（完整保留）
     readme = data.get('readme_content', '')
     if readme:
-        md_lines.append("## README Content")
-        md_lines.append("")
-        md_lines.append("```markdown")
-        md_lines.append(readme)
-        md_lines.append("```")
-        md_lines.append("")
+        yield "## README Content"
+        yield ""
+        yield "```markdown"
+        yield readme
+        yield "```"
+        yield ""
 
     # Issues（完整保留正文）
     issues = data.get('issues', [])
     if issues:
-        md_lines.append("## Issues")
-        md_lines.append("")
-        md_lines.append(f"Total Issues: {len(issues)}")
-        md_lines.append("")
+        yield "## Issues"
+        yield ""
+        yield f"Total Issues: {len(issues)}"
+        yield ""
         for issue in issues:
-            md_lines.append(f"### Issue #{issue.get('number')} - {issue.get('title', '')}")
-            md_lines.append("")
-            md_lines.append(f"- **State**: {issue.get('state', '')}")
-            md_lines.append(f"- **Author**: {issue.get('author', '')}")
-            md_lines.append(f"- **Created**: {issue.get('created_at', '')}")
-            md_lines.append(f"- **Updated**: {issue.get('updated_at', '')}")
-            md_lines.append(f"- **Comments**: {issue.get('comments', 0)}")
-            md_lines.append(f"- **Reactions**: {issue.get('reactions', 0)}")
-
-            labels = issue.get('labels', [])
+            # 每轮只绑定一次 .get，循环体内不再反复做属性查找
+            g = issue.get
+            yield f"### Issue #{g('number')} - {g('title', '')}"
+            yield ""
+            yield f"- **State**: {g('state', '')}"
+            yield f"- **Author**: {g('author', '')}"
+            yield f"- **Created**: {g('created_at', '')}"
+            yield f"- **Updated**: {g('updated_at', '')}"
+            yield f"- **Comments**: {g('comments', 0)}"
+            yield f"- **Reactions**: {g('reactions', 0)}"
+
+            labels = g('labels', [])
             if labels:
-                md_lines.append(f"- **Labels**: {', '.join(labels)}")
+                yield f"- **Labels**: {', '.join(labels)}"
 
-            md_lines.append("")
-            md_lines.append("**Body**:")
-            md_lines.append("")
-            md_lines.append("```")
-            md_lines.append(issue.get('body', '') or '(no content)')
-            md_lines.append("```")
-            md_lines.append("")
+            yield ""
+            yield "**Body**:"
+            yield ""
+            yield "```"
+            yield g('body', '') or '(no content)'
+            yield "```"
+            yield ""
 
     # Releases（完整保留发布说明）
     releases = data.get('releases', [])
     if releases:
-        md_lines.append("## Releases")
-        md_lines.append("")
-        md_lines.append(f"Total Releases: {len(releases)}")
-        md_lines.append("")
+        yield "## Releases"
+        yield ""
+        yield f"Total Releases: {len(releases)}"
+        yield ""
         for release in releases:
-            md_lines.append(f"### {release.get('name', '')} ({release.get('tag_name', '')})")
-            md_lines.append("")
-            md_lines.append(f"- **Published**: {release.get('published_at', '')}")
-            md_lines.append(f"- **Author**: {release.get('author', '')}")
-            md_lines.append(f"- **Prerelease**: {release.get('prerelease', False)}")
-            md_lines.append("")
-            md_lines.append("**Release Notes**:")
-            md_lines.append("")
-            md_lines.append("```markdown")
-            md_lines.append(release.get('body', '') or '(no release notes)')
-            md_lines.append("```")
-            md_lines.append("")
+            g = release.get
+            yield f"### {g('name', '')} ({g('tag_name', '')})"
+            yield ""
+            yield f"- **Published**: {g('published_at', '')}"
+            yield f"- **Author**: {g('author', '')}"
+            yield f"- **Prerelease**: {g('prerelease', False)}"
+            yield ""
+            yield "**Release Notes**:"
+            yield ""
+            yield "```markdown"
+            yield g('body', '') or '(no release notes)'
+            yield "```"
+            yield ""
 
     # Documents（完整保留内容）
     docs = data.get('documents', {})
     if docs:
-        md_lines.append("## Documentation Files")
-        md_lines.append("")
-        md_lines.append(f"Total Documents: {len(docs)}")
-        md_lines.append("")
+        yield "## Documentation Files"
+        yield ""
+        yield f"Total Documents: {len(docs)}"
+        yield ""
         for doc_name, doc_content in docs.items():
-            md_lines.append(f"### {doc_name}")
-            md_lines.append("")
-            md_lines.append("```markdown")
-            md_lines.append(doc_content)
-            md_lines.append("```")
-            md_lines.append("")
+            yield f"### {doc_name}"
+            yield ""
+            yield "```markdown"
+            yield doc_content
+            yield "```"
+            yield ""
 
     # PR 模板
     pr_template = data.get('pr_template', '')
     if pr_template:
-        md_lines.append("## Pull Request Template")
-        md_lines.append("")
-        md_lines.append("```markdown")
-        md_lines.append(pr_template)
-        md_lines.append("```")
-        md_lines.append("")
+        yield "## Pull Request Template"
+        yield ""
+        yield "```markdown"
+        yield pr_template
+        yield "```"
+        yield ""
 
     # Issue 模板
     issue_templates = data.get('issue_templates', [])
     if issue_templates:
-        md_lines.append("## Issue Templates")
-        md_lines.append("")
+        yield "## Issue Templates"
+        yield ""
         for template in issue_templates:
-            md_lines.append(f"- {template}")
-        md_lines.append("")
+            yield f"- {template}"
+        yield ""
 
     # GitHub Actions 工作流
     workflows = data.get('workflows', [])
     if workflows:
-        md_lines.append("## GitHub Actions Workflows")
-        md_lines.append("")
-        md_lines.append(f"Total Workflows: {len(workflows)}")
-        md_lines.append("")
+        yield "## GitHub Actions Workflows"
+        yield ""
+        yield f"Total Workflows: {len(workflows)}"
+        yield ""
         for workflow in workflows:
-            md_lines.append(f"- {workflow}")
-        md_lines.append("")
+            yield f"- {workflow}"
+        yield ""
 
     # 目录结构
     root_structure = data.get('root_structure', [])
     if root_structure:
-        md_lines.append("## Repository Root Structure")
-        md_lines.append("")
+        yield "## Repository Root Structure"
+        yield ""
         for item in root_structure:
             icon = "📁" if item.get('type') == 'dir' else "📄"
-            md_lines.append(f"{icon} {item.get('name', '')}")
-        md_lines.append("")
+            yield f"{icon} {item.get('name', '')}"
+        yield ""
 
     # Docs 目录
     docs_dir = data.get('docs_directory', [])
     if docs_dir:
-        md_lines.append("## Documentation Directory")
-        md_lines.append("")
+        yield "## Documentation Directory"
+        yield ""
         for item in docs_dir:
-            md_lines.append(f"- {item}")
-        md_lines.append("")
+            yield f"- {item}"
+        yield ""
 
     # README 链接
     readme_links = data.get('readme_links', [])
     if readme_links:
-        md_lines.append("## README Links")
-        md_lines.append("")
-        md_lines.append(f"Total Links: {len(readme_links)}")
-        md_lines.append("")
+        yield "## README Links"
+        yield ""
+        yield f"Total Links: {len(readme_links)}"
+        yield ""
         for link in readme_links[:20]:  # 限制前 20 个
             text = link.get('text', '')
             url = link.get('url', '')
-            md_lines.append(f"- [{text}]({url})")
+            yield f"- [{text}]({url})"
         if len(readme_links) > 20:
-            md_lines.append(f"- ... and {len(readme_links) - 20} more links")
-        md_lines.append("")
-
-    return "\n".join(md_lines)
+            yield f"- ... and {len(readme_links) - 20} more links"
+        yield ""
 
 
 def main():
@@ -223,20 +234,24 @@ def main():
 
     # 读取 JSON
     print(f"📖 读取: {args.input_file}")
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(args.input_file, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-    # 生成 Markdown
+    # 逐行生成 Markdown 并直接写盘，峰值内存只有单行大小
     print(f"🔄 生成 Markdown 格式...")
-    markdown_content = generate_markdown(data)
-
-    # 保存
+    total_chars = 0
+    total_lines = 0
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+        for line in iter_markdown(data):
+            f.write(line)
+            f.write('\n')
+            total_chars += len(line) + 1
+            total_lines += 1
 
     print(f"✅ Markdown 文件已保存: {output_file}")
-    print(f"📏 文件大小: {len(markdown_content):,} 字符")
-    print(f"📄 文件行数: {markdown_content.count(chr(10)) + 1:,} 行")
+    print(f"📏 文件大小: {total_chars:,} 字符")
+    print(f"📄 文件行数: {total_lines:,} 行")
     print(f"\n💡 现在 LLM 可以完整读取所有内容进行分析！")
 
 
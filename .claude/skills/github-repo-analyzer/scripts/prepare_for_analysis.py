@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = []
+# dependencies = [
+#   "orjson>=3.9",
+# ]
 # ///
 # -*- coding: utf-8 -*-
 """
@@ -16,181 +18,154 @@
 """
 
 import json
+import operator
 import sys
 import argparse
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-
-def extract_basic_info(data: Dict) -> Dict:
-    """提取基础信息（只保留有价值的字段，去除 API URLs 等无用信息）"""
-    basic = data.get('basic_info', {})
-    return {
-        'name': basic.get('name', ''),
-        'full_name': basic.get('full_name', ''),
-        'description': basic.get('description', ''),
-        'homepage': basic.get('homepage', ''),
-        'html_url': basic.get('html_url', ''),
-        'stars': basic.get('stargazers_count', 0),
-        'forks': basic.get('forks_count', 0),
-        'watchers': basic.get('watchers_count', 0),
-        'open_issues': basic.get('open_issues_count', 0),
-        'language': basic.get('language', ''),
-        'license': basic.get('license', {}).get('name', '') if basic.get('license') else '',
-        'topics': basic.get('topics', []),
-        'created_at': basic.get('created_at', ''),
-        'updated_at': basic.get('updated_at', ''),
-        'pushed_at': basic.get('pushed_at', ''),
-        'default_branch': basic.get('default_branch', ''),
-        'size_kb': basic.get('size', 0),
-        'is_fork': basic.get('fork', False),
-        'archived': basic.get('archived', False),
-    }
-
-
-def extract_readme(data: Dict) -> str:
-    """提取完整的 README 内容"""
-    readme = data.get('readme', {})
-    return readme.get('decoded_content', '')
-
-
-def extract_issues(data: Dict) -> List[Dict]:
-    """提取 Issues 信息（完整保留正文内容）"""
-    issues = data.get('issues', [])
-    extracted = []
-    
-    for issue in issues:
-        extracted.append({
-            'number': issue.get('number', 0),
-            'title': issue.get('title', ''),
-            'state': issue.get('state', ''),
-            'comments': issue.get('comments', 0),
-            'reactions': issue.get('reactions', {}).get('total_count', 0),
-            'created_at': issue.get('created_at', ''),
-            'updated_at': issue.get('updated_at', ''),
-            'author': issue.get('user', {}).get('login', ''),
-            'labels': [label.get('name', '') for label in issue.get('labels', [])],
-            'body': issue.get('body', '') or '',  # 完整保留正文
-        })
-    
-    return extracted
-
-
-def extract_releases(data: Dict) -> List[Dict]:
-    """提取 Releases 信息（完整保留发布说明）"""
-    releases = data.get('releases', [])
-    extracted = []
-    
-    for release in releases:
-        extracted.append({
-            'tag_name': release.get('tag_name', ''),
-            'name': release.get('name', ''),
-            'published_at': release.get('published_at', ''),
-            'author': release.get('author', {}).get('login', ''),
-            'prerelease': release.get('prerelease', False),
-            'body': release.get('body', '') or '',  # 完整保留发布说明
-        })
-    
-    return extracted
-
-
-def extract_docs(data: Dict) -> Dict[str, str]:
-    """提取文档内容（完整保留所有内容）"""
-    common_docs = data.get('common_docs', {})
-    extracted = {}
-    
-    for doc_name, doc_data in common_docs.items():
-        content = doc_data.get('decoded_content', '')
-        if content:
-            extracted[doc_name] = content  # 完整保留内容
-    
-    return extracted
-
-
-def extract_workflows(data: Dict) -> List[str]:
-    """提取工作流名称"""
-    workflows = data.get('workflows', [])
-    if not workflows:
-        return []
-    return [wf.get('name', 'unknown') for wf in workflows]
+# orjson 解析/序列化比 stdlib json 快数倍且省内存，不可用时回退 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def extract_root_structure(data: Dict) -> List[Dict]:
-    """提取根目录结构"""
-    root = data.get('root_contents', [])
-    if not root:
-        return []
-    return [
-        {'name': item.get('name', ''), 'type': item.get('type', '')}
-        for item in root
-    ]
+def load_json_file(path: str) -> Dict:
+    """读取 JSON 文件（优先 orjson）"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def extract_docs_directory(data: Dict) -> List[str]:
-    """提取 docs 目录结构"""
-    docs_dir = data.get('docs_directory', [])
-    if not docs_dir:
-        return []
-    return [item.get('name', '') for item in docs_dir]
-
-
-def extract_readme_links(data: Dict) -> List[Dict]:
-    """提取 README 中的链接"""
-    return data.get('readme_links', [])
-
-
-def extract_pr_template(data: Dict) -> str:
-    """提取 PR 模板内容"""
-    pr_template = data.get('pr_template', {})
-    if pr_template:
-        return pr_template.get('decoded_content', '')
-    return ''
-
-
-def extract_issue_templates(data: Dict) -> List[str]:
-    """提取 Issue 模板名称列表"""
-    templates = data.get('issue_templates', [])
-    if not templates:
-        return []
-    return [t.get('name', '') for t in templates]
+def dump_json_file(data: Dict, path: str) -> None:
+    """写出 JSON 文件（优先 orjson，保持 2 空格缩进）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+_LABEL_NAME = operator.itemgetter('name')
+
+# basic_info 批量取值：源字段、对应的输出字段、缺失时的默认值，
+# 一次 itemgetter 调用替代约 20 次逐字段 .get
+_BASIC_KEYS = (
+    'name', 'full_name', 'description', 'homepage', 'html_url',
+    'stargazers_count', 'forks_count', 'watchers_count', 'open_issues_count',
+    'language', 'topics', 'created_at', 'updated_at', 'pushed_at',
+    'default_branch', 'size', 'fork', 'archived',
+)
+_BASIC_OUTPUT_KEYS = (
+    'name', 'full_name', 'description', 'homepage', 'html_url',
+    'stars', 'forks', 'watchers', 'open_issues',
+    'language', 'topics', 'created_at', 'updated_at', 'pushed_at',
+    'default_branch', 'size_kb', 'is_fork', 'archived',
+)
+_BASIC_DEFAULTS = {
+    'name': '', 'full_name': '', 'description': '', 'homepage': '', 'html_url': '',
+    'stargazers_count': 0, 'forks_count': 0, 'watchers_count': 0, 'open_issues_count': 0,
+    'language': '', 'topics': [], 'created_at': '', 'updated_at': '', 'pushed_at': '',
+    'default_branch': '', 'size': 0, 'fork': False, 'archived': False,
+}
+_BASIC_GETTER = operator.itemgetter(*_BASIC_KEYS)
 
 
 def prepare_for_analysis(input_file: str, output_file: Optional[str] = None) -> Dict:
     """
     主处理函数：从完整 JSON 提取关键文本信息
-    
+
     核心原则：
     - 去除无用元数据（API URLs、SHA、node_id 等）
     - 保留所有有价值的文本内容（不截断）
     - 生成结构清晰的数据
-    
+
+    所有字段在一趟遍历中就地提取，顶层 dict 只回表一次，
+    避免为大 Issue/Release 数组分配多余的中间列表。
+
     Args:
         input_file: 输入的完整 JSON 文件路径
         output_file: 输出的精简 JSON 文件路径（可选）
-    
+
     Returns:
         精简后的数据字典
     """
     # 读取原始数据
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # 提取关键信息（完整保留文本内容）
+    data = load_json_file(input_file)
+
+    # 基础信息（只保留有价值的字段，去除 API URLs 等无用信息）：
+    # 缺失字段先用默认值补齐，再用预构建的 itemgetter 一次批量取出
+    basic = data.get('basic_info') or {}
+    safe = dict(_BASIC_DEFAULTS)
+    safe.update(basic)
+    basic_info = dict(zip(_BASIC_OUTPUT_KEYS, _BASIC_GETTER(safe)))
+    # license 是嵌套结构，单独展开
+    license_info = basic.get('license')
+    basic_info['license'] = license_info.get('name', '') if license_info else ''
+
+    # Issues（完整保留正文内容），预分配列表按下标填充
+    raw_issues = data.get('issues') or []
+    issues: List[Dict] = [None] * len(raw_issues)
+    for i, issue in enumerate(raw_issues):
+        ig = issue.get
+        issues[i] = {
+            'number': ig('number', 0),
+            'title': ig('title', ''),
+            'state': ig('state', ''),
+            'comments': ig('comments', 0),
+            'reactions': (ig('reactions') or {}).get('total_count', 0),
+            'created_at': ig('created_at', ''),
+            'updated_at': ig('updated_at', ''),
+            'author': (ig('user') or {}).get('login', ''),
+            'labels': list(map(_LABEL_NAME, ig('labels') or ())),
+            'body': ig('body', '') or '',  # 完整保留正文
+        }
+
+    # Releases（完整保留发布说明）
+    raw_releases = data.get('releases') or []
+    releases: List[Dict] = [None] * len(raw_releases)
+    for i, release in enumerate(raw_releases):
+        rg = release.get
+        releases[i] = {
+            'tag_name': rg('tag_name', ''),
+            'name': rg('name', ''),
+            'published_at': rg('published_at', ''),
+            'author': (rg('author') or {}).get('login', ''),
+            'prerelease': rg('prerelease', False),
+            'body': rg('body', '') or '',  # 完整保留发布说明
+        }
+
+    # 文档内容（完整保留所有内容）
+    documents = {
+        doc_name: content
+        for doc_name, doc_data in (data.get('common_docs') or {}).items()
+        if (content := doc_data.get('decoded_content', ''))
+    }
+
+    pr_template = (data.get('pr_template') or {}).get('decoded_content', '')
+
     analysis_data = {
         'repository_url': data.get('repository_url', ''),
         'owner': data.get('owner', ''),
         'repo': data.get('repo', ''),
-        'basic_info': extract_basic_info(data),
-        'readme_content': extract_readme(data),
-        'readme_links': extract_readme_links(data),
-        'issues': extract_issues(data),
-        'releases': extract_releases(data),
-        'documents': extract_docs(data),
-        'pr_template': extract_pr_template(data),
-        'issue_templates': extract_issue_templates(data),
-        'workflows': extract_workflows(data),
-        'root_structure': extract_root_structure(data),
-        'docs_directory': extract_docs_directory(data),
+        'basic_info': basic_info,
+        'readme_content': (data.get('readme') or {}).get('decoded_content', ''),
+        'readme_links': data.get('readme_links', []),
+        'issues': issues,
+        'releases': releases,
+        'documents': documents,
+        'pr_template': pr_template,
+        'issue_templates': [t.get('name', '') for t in data.get('issue_templates') or ()],
+        'workflows': [wf.get('name', 'unknown') for wf in data.get('workflows') or ()],
+        'root_structure': [
+            {'name': item.get('name', ''), 'type': item.get('type', '')}
+            for item in data.get('root_contents') or ()
+        ],
+        'docs_directory': [item.get('name', '') for item in data.get('docs_directory') or ()],
     }
     
     # 添加统计信息
@@ -207,8 +182,7 @@ def prepare_for_analysis(input_file: str, output_file: Optional[str] = None) ->
     
     # 保存到文件
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data, f, ensure_ascii=False, indent=2)
+        dump_json_file(analysis_data, output_file)
         print(f"✅ 分析就绪数据已保存到: {output_file}")
     
     return analysis_data